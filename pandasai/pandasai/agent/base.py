@@ -36,6 +36,11 @@ from ..schemas.df_config import Config
 from ..skills import Skill
 from .callbacks import Callbacks
 
+MALICIOUS_KEYWORDS_PATTERN = re.compile(
+    r"\b(os|io|chr|b64decode)\b|"
+    r"(\.os|\.io|'os'|'io'|\"os\"|\"io\"|chr\(|chr\)|chr |\(chr)"
+)
+
 
 class BaseAgent:
     """
@@ -235,11 +240,7 @@ class BaseAgent:
                 retry_count += 1
 
     def check_malicious_keywords_in_query(self, query):
-        dangerous_pattern = re.compile(
-            r"\b(os|io|chr|b64decode)\b|"
-            r"(\.os|\.io|'os'|'io'|\"os\"|\"io\"|chr\(|chr\)|chr |\(chr)"
-        )
-        return bool(dangerous_pattern.search(query))
+        return bool(MALICIOUS_KEYWORDS_PATTERN.search(query))
 
     def chat(self, query: str, output_type: Optional[str] = None):
         """
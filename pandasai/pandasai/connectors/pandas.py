@@ -3,7 +3,7 @@ Pandas connector class to handle csv, parquet, xlsx files and pandas dataframes.
 """
 
 import hashlib
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
 from typing import Union
 
 import duckdb
@@ -19,6 +19,12 @@ from ..helpers.logger import Logger
 from .base import BaseConnector
 
 
+@lru_cache(maxsize=128)
+def transpile_to_duckdb(sql_query: str) -> str:
+    """Transpile a MySQL query to the DuckDB dialect, caching repeated queries."""
+    return sqlglot.transpile(sql_query, read="mysql", write="duckdb")[0]
+
+
 class PandasConnectorConfig(BaseModel):
     """
     Pandas Connector configuration.
@@ -183,7 +189,7 @@ class PandasConnector(BaseConnector):
         if not self.sql_enabled:
             self.enable_sql_query()
 
-        sql_query = sqlglot.transpile(sql_query, read="mysql", write="duckdb")[0]
+        sql_query = transpile_to_duckdb(sql_query)
         return duckdb.query(sql_query).df()
 
     @property
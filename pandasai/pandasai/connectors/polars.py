@@ -2,6 +2,7 @@
 Polars connector class to handle csv, parquet, xlsx files and polars dataframes.
 """
 
+import hashlib
 from functools import cache, cached_property
 from typing import TYPE_CHECKING, Any, Union
 
@@ -148,8 +149,6 @@ class PolarsConnector(BaseConnector):
         Return the hash code that is unique to the columns of the data source
         that the connector is connected to.
         """
-        import hashlib
-
         columns_str = "".join(self.pandas_df.columns)
         hash_object = hashlib.sha256(columns_str.encode())
         return hash_object.hexdigest()
@@ -20,6 +20,11 @@ from pandasai.helpers.path import find_project_root
 from ..constants import DEFAULT_FILE_PERMISSIONS
 from .base import BaseConnector, BaseConnectorConfig
 
+COLUMN_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]+$")
+MALICIOUS_SQL_KEYWORDS_PATTERN = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|DROP|EXEC|ALTER|CREATE)\b", re.IGNORECASE
+)
+
 
 class SQLBaseConnectorConfig(BaseConnectorConfig):
     """
@@ -144,8 +149,7 @@ class SQLConnector(BaseConnector):
         )
 
     def _validate_column_name(self, column_name):
-        regex = r"^[a-zA-Z0-9_]+$"
-        if not re.match(regex, column_name):
+        if not COLUMN_NAME_PATTERN.match(column_name):
             raise ValueError(f"Invalid column name: {column_name}")
 
     def _build_query(self, limit=None, order=None):
@@ -423,19 +427,7 @@ class SQLConnector(BaseConnector):
         return False
 
     def _is_sql_query_safe(self, query: str):
-        infected_keywords = [
-            r"\bINSERT\b",
-            r"\bUPDATE\b",
-            r"\bDELETE\b",
-            r"\bDROP\b",
-            r"\bEXEC\b",
-            r"\bALTER\b",
-            r"\bCREATE\b",
-        ]
-
-        return not any(
-            re.search(keyword, query, re.IGNORECASE) for keyword in infected_keywords
-        )
+        return MALICIOUS_SQL_KEYWORDS_PATTERN.search(query) is None
 
     def execute_direct_sql_query(self, sql_query):
         if not self._is_sql_query_safe(sql_query):
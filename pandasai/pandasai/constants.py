@@ -102,6 +102,46 @@ WHITELISTED_LIBRARIES = [
     "scikit-learn",
 ]
 
+# List of module and function references that are not allowed in generated code
+DANGEROUS_MODULES = [
+    " os",
+    " io",
+    ".os",
+    ".io",
+    "'os'",
+    "'io'",
+    '"os"',
+    '"io"',
+    "chr(",
+    "chr)",
+    "chr ",
+    "(chr",
+    "b64decode",
+]
+
+# List of builtins that are used to break out of the sandbox in generated code
+DANGEROUS_BUILTINS = ["__subclasses__", "__builtins__", "__import__"]
+
+# List of dataframe methods that write data out and are not allowed in
+# generated code
+UNSAFE_DATAFRAME_METHODS = [
+    ".to_csv",
+    ".to_excel",
+    ".to_json",
+    ".to_sql",
+    ".to_feather",
+    ".to_hdf",
+    ".to_parquet",
+    ".to_pickle",
+    ".to_gbq",
+    ".to_stata",
+    ".to_records",
+    ".to_latex",
+    ".to_html",
+    ".to_markdown",
+    ".to_clipboard",
+]
+
 PANDASBI_SETUP_MESSAGE = (
     "The api_key client option must be set either by passing api_key to the client "
     "or by setting the PANDASAI_API_KEY environment variable. To get the key follow below steps:\n"
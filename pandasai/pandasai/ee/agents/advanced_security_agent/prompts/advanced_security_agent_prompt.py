@@ -1,8 +1,10 @@
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
-
-from pandasai.prompts.base import BasePrompt
+from pandasai.prompts.base import (
+    BasePrompt,
+    compile_template,
+    get_templates_environment,
+)
 
 
 class AdvancedSecurityAgentPrompt(BasePrompt):
@@ -15,14 +17,13 @@ class AdvancedSecurityAgentPrompt(BasePrompt):
         self.props = kwargs
 
         if self.template:
-            env = Environment()
-            self.prompt = env.from_string(self.template)
+            self.prompt = compile_template(self.template)
         elif self.template_path:
             # find path to template file
             current_dir_path = Path(__file__).parent
 
             path_to_template = current_dir_path / "templates"
-            env = Environment(loader=FileSystemLoader(path_to_template))
+            env = get_templates_environment(str(path_to_template))
             self.prompt = env.get_template(self.template_path)
 
         self._resolved_prompt = None
@@ -1,14 +1,13 @@
 import json
+import re
 
+JSON_CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S | re.I)
 
-def extract_json_from_json_str(json_str):
-    start_index = json_str.find("```json")
 
-    end_index = json_str.find("```", start_index)
+def extract_json_from_json_str(json_str):
+    match = JSON_CODE_FENCE_PATTERN.search(json_str)
 
-    if start_index == -1:
+    if match is None:
         return json.loads(json_str)
 
-    json_data = json_str[(start_index + len("```json")) : end_index].strip()
-
-    return json.loads(json_data)
+    return json.loads(match.group(1))
@@ -4,6 +4,7 @@ from pandasai.exceptions import InvalidSchemaJson
 
 MISSING_TABLE_NAME_MESSAGE = "All measures, dimensions, timeDimensions, order and filters must have the format Table_Name.Dimension or Table_Name.Measure"
 TABLE_NOT_FOUND_MESSAGE = "Table {0} Doesn't exist"
+COLUMN_REFERENCE_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
 
 class QueryBuilder:
@@ -544,7 +545,7 @@ class QueryBuilder:
                 raise ValueError(f"Column '{column}' not found in schema.")
             return f"`{new_table['table']}`.`{new_column['sql']}`"
 
-        return re.sub(r"\$\{([^}]+)\}", replace_column, template)
+        return COLUMN_REFERENCE_PATTERN.sub(replace_column, template)
 
     def find_table(self, table_name):
         return next((table for table in self.schema if table["name"] == table_name), {})
@@ -9,6 +9,12 @@ import string
 
 import pandasai.pandas as pd
 
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+PHONE_NUMBER_PATTERN = re.compile(
+    r"\b(?:\+?\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}\b"
+)
+CREDIT_CARD_PATTERN = re.compile(r"^\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}$")
+
 
 class Anonymizer:
     @staticmethod
@@ -21,8 +27,7 @@ class Anonymizer:
         Returns (bool): True if the email is valid, otherwise False.
         """
 
-        email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(email_regex, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
 
     @staticmethod
     def _is_valid_phone_number(phone_number) -> bool:
@@ -34,8 +39,7 @@ class Anonymizer:
         Returns (bool): True if the phone number is valid, otherwise False.
         """
 
-        pattern = r"\b(?:\+?\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}\b"
-        return re.search(pattern, phone_number) is not None
+        return PHONE_NUMBER_PATTERN.search(phone_number) is not None
 
     @staticmethod
     def _is_valid_credit_card(card_number) -> bool:
@@ -47,8 +51,7 @@ class Anonymizer:
         Returns (str): True if the credit card number is valid, otherwise False.
         """
 
-        pattern = r"^\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}$"
-        return re.search(pattern, card_number) is not None
+        return CREDIT_CARD_PATTERN.search(card_number) is not None
 
     @staticmethod
     def _generate_random_email() -> str:
@@ -15,6 +15,9 @@ import pandasai.pandas as pd
 
 from .anonymizer import Anonymizer
 
+# maximum number of rows scanned per column to collect candidate values
+MAX_ROWS_TO_SCAN = 1000
+
 
 class DataSampler:
     def __init__(self, df: pd.DataFrame):
@@ -33,35 +36,48 @@ class DataSampler:
         Returns:
             pd.DataFrame: Sampled dataframe.
         """
-        sampled_df = pd.DataFrame()
         if len(self.df) <= n:
             sampled_df = self.df.sample(frac=1)
         else:
-            for col in self.df.columns:
-                col_sample = self._sample_column(col, n)
-                sampled_df[col] = col_sample
+            # compute the null flags for all the columns in a single pass
+            columns_with_nulls = self.df.isna().any()
+            sampled_df = pd.DataFrame(
+                {
+                    col: self._sample_column(column, n, has_nulls)
+                    for (col, column), has_nulls in zip(
+                        self.df.items(), columns_with_nulls
+                    )
+                }
+            )
 
         # anonymize the sampled dataframe head
         sampled_df = Anonymizer.anonymize_dataframe_head(sampled_df)
 
         return sampled_df
 
-    def _sample_column(self, col: str, n: int) -> list:
+    def _sample_column(self, column: pd.Series, n: int, has_nulls: bool) -> list:
         """Sample a column.
 
         Args:
-            col (str): Column name.
+            column (pd.Series): Column to sample from.
             n (int): Number of rows to sample.
+            has_nulls (bool): Whether the column contains null values.
 
         Returns:
             list: Sampled column.
         """
 
         col_sample = []
-        col_values = self.df[col].dropna().unique()
+        # candidate values are drawn from a random subset of the non-null rows, so
+        # that large dataframes don't need a full unique() scan per column
+        non_null_values = column.dropna()
+        if len(non_null_values) > MAX_ROWS_TO_SCAN:
+            positions = random.sample(range(len(non_null_values)), MAX_ROWS_TO_SCAN)
+            non_null_values = non_null_values.iloc[positions]
+        col_values = list(non_null_values.unique())
 
         # if there is a null value in the column, it MUST be included in the sample
-        if self.df[col].isna().any():
+        if has_nulls:
             col_sample.append(np.nan)
             n -= 1
 
@@ -71,12 +87,12 @@ class DataSampler:
             col_sample.extend(col_values)
             n -= len(col_values)
         else:
-            col_sample.extend(random.sample(list(col_values), n))
+            col_sample.extend(random.sample(col_values, n))
             n = 0
 
         # if there are still rows to sample, sample them randomly
         if n > 0 and len(col_values) > 0:
-            col_sample.extend(random.choices(list(col_values), k=n))
+            col_sample.extend(random.choices(col_values, k=n))
         else:
             col_sample.extend([np.nan] * n)
 
@@ -42,25 +42,25 @@ class DataframeSerializer:
         Returns:
             str: dataframe stringify
         """
-        dataframe_info = "<dataframe"
+        dataframe_info = ["<dataframe"]
 
         # Add name attribute if available
         if df.name is not None:
-            dataframe_info += f' name="{df.name}"'
+            dataframe_info.append(f' name="{df.name}"')
 
         # Add description attribute if available
         if df.description is not None:
-            dataframe_info += f' description="{df.description}"'
-
-        dataframe_info += ">"
+            dataframe_info.append(f' description="{df.description}"')
 
         # Add dataframe details
-        dataframe_info += f"\ndfs[{extras['index']}]:{df.rows_count}x{df.columns_count}\n{df.to_csv()}"
+        dataframe_info.append(
+            f">\ndfs[{extras['index']}]:{df.rows_count}x{df.columns_count}\n{df.to_csv()}"
+        )
 
         # Close the dataframe tag
-        dataframe_info += "</dataframe>\n"
+        dataframe_info.append("</dataframe>\n")
 
-        return dataframe_info
+        return "".join(dataframe_info)
 
     def convert_df_sql_connector_to_str(
         self, df: pd.DataFrame, extras: dict = None
@@ -110,6 +110,17 @@ class DataframeSerializer:
             "schema": {"fields": []},
         }
 
+        # Map each column to its primary/foreign key constraint, if any
+        constraints = {}
+        if df.connector_relations:
+            from pandasai.ee.connectors.relations import ForeignKey, PrimaryKey
+
+            for relation in df.connector_relations:
+                if isinstance(relation, PrimaryKey):
+                    constraints[relation.name] = relation.to_string()
+                elif isinstance(relation, ForeignKey):
+                    constraints[relation.field] = relation.to_string()
+
         # Iterate over DataFrame columns
         df_head = df.get_head()
         for col_name, col_dtype in df_head.dtypes.items():
@@ -126,16 +137,8 @@ class DataframeSerializer:
                 if col_description := df.field_descriptions.get(col_name, None):
                     col_info["description"] = col_description
 
-            if df.connector_relations:
-                for relation in df.connector_relations:
-                    from pandasai.ee.connectors.relations import ForeignKey, PrimaryKey
-
-                    if (
-                        isinstance(relation, PrimaryKey) and relation.name == col_name
-                    ) or (
-                        isinstance(relation, ForeignKey) and relation.field == col_name
-                    ):
-                        col_info["constraints"] = relation.to_string()
+            if col_name in constraints:
+                col_info["constraints"] = constraints[col_name]
 
             data["schema"]["fields"].append(col_info)
 
@@ -41,10 +41,15 @@ class Memory:
         """
         limit = self._memory_size if limit is None else limit
 
-        return [
-            f"{'### QUERY' if message['is_user'] else '### ANSWER'}\n {message['message'] if message['is_user'] else self._truncate(message['message'])}"
-            for message in self._messages[-limit:]
-        ]
+        return [self._format_message(message) for message in self._messages[-limit:]]
+
+    def _format_message(self, message: dict) -> str:
+        """
+        Formats a single message as a query or (truncated) answer block
+        """
+        if message["is_user"]:
+            return f"### QUERY\n {message['message']}"
+        return f"### ANSWER\n {self._truncate(message['message'])}"
 
     def get_conversation(self, limit: int = None) -> str:
         """
@@ -57,47 +62,45 @@ class Memory:
         """
         Returns the previous conversation but the last message
         """
-        messages = self.get_messages(self._memory_size)
-        return "" if len(messages) <= 1 else "\n".join(messages[:-1])
+        messages = self._messages[-self._memory_size :]
+        return "\n".join(self._format_message(message) for message in messages[:-1])
 
     def get_last_message(self) -> str:
         """
         Returns the last message in the conversation
         """
-        messages = self.get_messages(self._memory_size)
-        return "" if len(messages) == 0 else messages[-1]
+        if len(self._messages) == 0:
+            return ""
+        return self._format_message(self._messages[-1])
 
     def get_system_prompt(self) -> str:
         return self._agent_info
 
     def to_json(self):
-        messages = []
-        for message in self.all():
-            if message["is_user"]:
-                messages.append({"role": "user", "message": message["message"]})
-            else:
-                messages.append({"role": "assistant", "message": message["message"]})
-        return messages
+        return [
+            {"role": self._role(message), "message": message["message"]}
+            for message in self._messages
+        ]
 
     def to_openai_messages(self):
         """
         Returns the conversation messages in the format expected by the OpenAI API
         """
-        messages = []
-        if self.agent_info:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": self.get_system_prompt(),
-                }
-            )
-        for message in self.all():
-            if message["is_user"]:
-                messages.append({"role": "user", "content": message["message"]})
-            else:
-                messages.append({"role": "assistant", "content": message["message"]})
+        messages = (
+            [{"role": "system", "content": self.get_system_prompt()}]
+            if self.agent_info
+            else []
+        )
+        messages.extend(
+            {"role": self._role(message), "content": message["message"]}
+            for message in self._messages
+        )
         return messages
 
+    @staticmethod
+    def _role(message: dict) -> str:
+        return "user" if message["is_user"] else "assistant"
+
     def clear(self):
         self._messages = []
 
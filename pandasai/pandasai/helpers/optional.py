@@ -37,6 +37,14 @@ VERSIONS = {
 
 INSTALL_MAPPING = {}
 
+# Builtins available to the generated code. get_environment hands out a copy,
+# so that one execution can't leak changes into the next.
+SAFE_BUILTINS = {
+    **{builtin: __builtins__[builtin] for builtin in WHITELISTED_BUILTINS},
+    "__build_class__": __build_class__,
+    "__name__": "__main__",
+}
+
 
 def get_version(module: types.ModuleType) -> str:
     """Get the version of a module."""
@@ -54,24 +62,14 @@ def get_environment(additional_deps: List[dict]) -> dict:
 
     Returns (dict): A dictionary of environment variables
     """
-    return {
-        "pd": pd,
-        "plt": plt,
-        "np": np,
-        **{
-            lib["alias"]: (
-                getattr(import_dependency(lib["module"]), lib["name"])
-                if hasattr(import_dependency(lib["module"]), lib["name"])
-                else import_dependency(lib["module"])
-            )
-            for lib in additional_deps
-        },
-        "__builtins__": {
-            **{builtin: __builtins__[builtin] for builtin in WHITELISTED_BUILTINS},
-            "__build_class__": __build_class__,
-            "__name__": "__main__",
-        },
-    }
+    environment = {"pd": pd, "plt": plt, "np": np}
+
+    for lib in additional_deps:
+        module = import_dependency(lib["module"])
+        environment[lib["alias"]] = getattr(module, lib["name"], module)
+
+    environment["__builtins__"] = dict(SAFE_BUILTINS)
+    return environment
 
 
 def import_dependency(
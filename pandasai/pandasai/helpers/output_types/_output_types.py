@@ -5,6 +5,8 @@ from typing import Any, Iterable
 
 from ..df_info import df_type
 
+PATH_TO_PLOT_PATTERN = re.compile(r"^(\/[\w.-]+)+(/[\w.-]+)*$|^[^\s/]+(/[\w.-]+)*$")
+
 
 class BaseOutputType(ABC):
     @property
@@ -100,8 +102,7 @@ class PlotOutputType(BaseOutputType):
         if not isinstance(actual_value, str):
             return False
 
-        path_to_plot_pattern = r"^(\/[\w.-]+)+(/[\w.-]+)*$|^[^\s/]+(/[\w.-]+)*$"
-        return bool(re.match(path_to_plot_pattern, actual_value))
+        return bool(PATH_TO_PLOT_PATTERN.match(actual_value))
 
 
 class StringOutputType(BaseOutputType):
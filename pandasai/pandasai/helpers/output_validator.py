@@ -1,10 +1,10 @@
-import re
 from typing import Any, Iterable
 
 import numpy as np
 
 import pandasai.pandas as pd
 from pandasai.exceptions import InvalidOutputValueMismatch
+from pandasai.helpers.output_types._output_types import PATH_TO_PLOT_PATTERN
 
 
 class OutputValidator:
@@ -64,8 +64,7 @@ class OutputValidator:
             if isinstance(self, dict):
                 return True
 
-            path_to_plot_pattern = r"^(\/[\w.-]+)+(/[\w.-]+)*$|^[^\s/]+(/[\w.-]+)*$"
-            return bool(re.match(path_to_plot_pattern, self))
+            return bool(PATH_TO_PLOT_PATTERN.match(self))
 
     @staticmethod
     def validate_result(result: dict) -> bool:
@@ -96,5 +95,4 @@ class OutputValidator:
             ):
                 return True
 
-            path_to_plot_pattern = r"^(\/[\w.-]+)+(/[\w.-]+)*$|^[^\s/]+(/[\w.-]+)*$"
-            return bool(re.match(path_to_plot_pattern, result["value"]))
+            return bool(PATH_TO_PLOT_PATTERN.match(result["value"]))
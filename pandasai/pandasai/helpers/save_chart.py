@@ -23,15 +23,16 @@ def add_save_chart(
         str: Code with line added.
 
     """
-    save_charts_path = Path(save_charts_path_str) if save_charts_path_str else None
+    # Nothing to redirect if the code doesn't save a chart
+    if not save_charts_path_str or "temp_chart.png" not in code:
+        return code
 
-    if save_charts_path is not None:
-        save_charts_path.mkdir(parents=True, exist_ok=True)
+    save_charts_path = Path(save_charts_path_str)
+    save_charts_path.mkdir(parents=True, exist_ok=True)
 
-        save_charts_file = save_charts_path / f"{file_name}.png"
+    save_charts_file = save_charts_path / f"{file_name}.png"
 
-        if "temp_chart.png" in code:
-            code = code.replace("temp_chart.png", save_charts_file.as_posix())
-            logger.log(f"Saving charts to {save_charts_file}")
+    code = code.replace("temp_chart.png", save_charts_file.as_posix())
+    logger.log(f"Saving charts to {save_charts_file}")
 
     return code
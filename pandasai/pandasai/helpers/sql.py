@@ -1,10 +1,12 @@
 import re
 
+# Regular expression pattern to match table names in FROM and JOIN clauses
+TABLE_NAME_PATTERN = re.compile(
+    r"(?:FROM|JOIN)\s+(?<!:)(\"?\w+\"?)(?=\s|$)", re.IGNORECASE
+)
 
-def extract_table_names(sql_query):
-    # Regular expression pattern to match table names in FROM and JOIN clauses
-    pattern = r"(?:FROM|JOIN)\s+(?<!:)(\"?\w+\"?)(?=\s|$)"
 
+def extract_table_names(sql_query):
     # Find all matches in the SQL query
-    matches = re.findall(pattern, sql_query, re.IGNORECASE)
+    matches = TABLE_NAME_PATTERN.findall(sql_query)
     return matches
@@ -36,6 +36,9 @@ from ..prompts.base import BasePrompt
 if TYPE_CHECKING:
     from pandasai.pipelines.pipeline_context import PipelineContext
 
+LANGUAGE_PREFIX_PATTERN = re.compile(r"^(python|py)")
+SURROUNDING_BACKTICKS_PATTERN = re.compile(r"^`(.*)`$")
+
 
 class LLM:
     """Base class to implement a new LLM."""
@@ -78,10 +81,10 @@ class LLM:
             str: Polished code.
 
         """
-        if re.match(r"^(python|py)", code):
-            code = re.sub(r"^(python|py)", "", code)
-        if re.match(r"^`.*`$", code):
-            code = re.sub(r"^`(.*)`$", r"\1", code)
+        if code.startswith("py"):
+            code = LANGUAGE_PREFIX_PATTERN.sub("", code)
+        if code.startswith("`"):
+            code = SURROUNDING_BACKTICKS_PATTERN.sub(r"\1", code)
         code = code.strip()
         return code
 
@@ -118,8 +121,8 @@ class LLM:
         code = response
 
         # If separator is in the response then we want the code in between only
-        if separator in response and len(code.split(separator)) > 1:
-            code = code.split(separator)[1]
+        if separator in response:
+            code = code.split(separator, 2)[1]
         code = self._polish_code(code)
 
         # Even if the separator is not in the response, the output might still be valid python code
@@ -231,6 +234,19 @@ class BaseOpenAI(LLM):
     http_client: Union[Any, None] = None
     client: Any
     _is_chat_model: bool
+    _valid_params = frozenset(
+        [
+            "model",
+            "deployment_name",
+            "temperature",
+            "max_tokens",
+            "top_p",
+            "frequency_penalty",
+            "presence_penalty",
+            "stop",
+            "seed",
+        ]
+    )
 
     def _set_params(self, **kwargs):
         """
@@ -244,19 +260,8 @@ class BaseOpenAI(LLM):
 
         """
 
-        valid_params = [
-            "model",
-            "deployment_name",
-            "temperature",
-            "max_tokens",
-            "top_p",
-            "frequency_penalty",
-            "presence_penalty",
-            "stop",
-            "seed",
-        ]
         for key, value in kwargs.items():
-            if key in valid_params:
+            if key in self._valid_params:
                 setattr(self, key, value)
 
     @property
@@ -15,7 +15,13 @@ from pandasai.helpers.sql import extract_table_names
 
 from ...connectors import BaseConnector
 from ...connectors.sql import SQLConnector
-from ...constants import WHITELISTED_BUILTINS, WHITELISTED_LIBRARIES
+from ...constants import (
+    DANGEROUS_BUILTINS,
+    DANGEROUS_MODULES,
+    UNSAFE_DATAFRAME_METHODS,
+    WHITELISTED_BUILTINS,
+    WHITELISTED_LIBRARIES,
+)
 from ...exceptions import (
     BadImportError,
     ExecuteSQLQueryNotUsed,
@@ -29,6 +35,13 @@ from ..base_logic_unit import BaseLogicUnit
 from ..logic_unit_output import LogicUnitOutput
 from ..pipeline_context import PipelineContext
 
+PLOT_PNG_PATTERN = re.compile(r"""(['"])([^'"]*\.png)\1""")
+WHITELISTED_BUILTINS_SET = frozenset(WHITELISTED_BUILTINS)
+WHITELISTED_LIBRARIES_SET = frozenset(WHITELISTED_LIBRARIES)
+MALICIOUS_CODE_PATTERN = re.compile(
+    "|".join(r"\b" + re.escape(module) + r"\b" for module in DANGEROUS_MODULES)
+)
+
 
 class CodeExecutionContext:
     def __init__(
@@ -118,7 +131,9 @@ class CodeCleaning(BaseLogicUnit):
         Returns:
             str: Python code with plot.png replaced with temp_chart.png
         """
-        return re.sub(r"""(['"])([^'"]*\.png)\1""", r"\1temp_chart.png\1", code)
+        if ".png" not in code:
+            return code
+        return PLOT_PNG_PATTERN.sub(r"\1temp_chart.png\1", code)
 
     def get_code_to_run(self, code: str, context: CodeExecutionContext) -> Any:
         if self._is_malicious_code(code):
@@ -161,25 +176,7 @@ Code running:
         return code_to_run
 
     def _is_malicious_code(self, code) -> bool:
-        dangerous_modules = [
-            " os",
-            " io",
-            ".os",
-            ".io",
-            "'os'",
-            "'io'",
-            '"os"',
-            '"io"',
-            "chr(",
-            "chr)",
-            "chr ",
-            "(chr",
-            "b64decode",
-        ]
-        return any(
-            re.search(r"\b" + re.escape(module) + r"\b", code)
-            for module in dangerous_modules
-        )
+        return MALICIOUS_CODE_PATTERN.search(code) is not None
 
     def _is_jailbreak(self, node: ast.stmt) -> bool:
         """
@@ -189,45 +186,21 @@ Code running:
         Returns (bool):
         """
 
-        DANGEROUS_BUILTINS = ["__subclasses__", "__builtins__", "__import__"]
-
         node_str = ast.dump(node)
 
         return any(builtin in node_str for builtin in DANGEROUS_BUILTINS)
 
-    def _is_unsafe(self, node: ast.stmt) -> bool:
+    def _is_unsafe(self, code: str) -> bool:
         """
         Remove unsafe code from the code to prevent malicious code execution.
 
         Args:
-            node (ast.stmt): A code node to be checked.
+            code (str): Source of a code node to be checked.
 
         Returns (bool):
         """
 
-        code = astor.to_source(node)
-        return any(
-            (
-                method in code
-                for method in [
-                    ".to_csv",
-                    ".to_excel",
-                    ".to_json",
-                    ".to_sql",
-                    ".to_feather",
-                    ".to_hdf",
-                    ".to_parquet",
-                    ".to_pickle",
-                    ".to_gbq",
-                    ".to_stata",
-                    ".to_records",
-                    ".to_latex",
-                    ".to_html",
-                    ".to_markdown",
-                    ".to_clipboard",
-                ]
-            )
-        )
+        return any(method in code for method in UNSAFE_DATAFRAME_METHODS)
 
     def find_function_calls(self, node: ast.AST, context: CodeExecutionContext):
         if isinstance(node, ast.Call):
@@ -244,9 +217,9 @@ Code running:
         for child_node in ast.iter_child_nodes(node):
             self.find_function_calls(child_node, context)
 
-    def check_direct_sql_func_def_exists(self, node: ast.AST):
+    def check_direct_sql_func_def_exists(self, node: ast.AST, is_direct_sql: bool):
         return (
-            self._validate_direct_sql(self._dfs)
+            is_direct_sql
             and isinstance(node, ast.FunctionDef)
             and node.name == "execute_sql_query"
         )
@@ -283,20 +256,26 @@ Code running:
     def _replace_table_names(
         self, sql_query: str, table_names: list, allowed_table_names: list
     ):
-        regex_patterns = {
-            table_name: re.compile(r"\b" + re.escape(table_name) + r"\b")
-            for table_name in table_names
-        }
         for table_name in table_names:
-            if table_name in allowed_table_names.keys():
-                quoted_table_name = allowed_table_names[table_name]
-                sql_query = regex_patterns[table_name].sub(quoted_table_name, sql_query)
-            else:
+            if table_name not in allowed_table_names:
                 raise MaliciousQueryError(
                     f"Query uses unauthorized table: {table_name}."
                 )
 
-        return sql_query
+        if not table_names:
+            return sql_query
+
+        # Replace all the table names in a single pass, longest names first so
+        # that a name is never replaced by a shorter one it contains
+        table_names_pattern = re.compile(
+            "|".join(
+                r"\b" + re.escape(table_name) + r"\b"
+                for table_name in sorted(set(table_names), key=len, reverse=True)
+            )
+        )
+        return table_names_pattern.sub(
+            lambda match: allowed_table_names[match.group(0)], sql_query
+        )
 
     def _clean_sql_query(self, sql_query: str) -> str:
         """
@@ -481,6 +460,9 @@ Code running:
         # Check for imports and the node where analyze_data is defined
         new_body = []
         execute_sql_query_used = False
+        # The dataframes don't change while cleaning, so they are validated once,
+        # at the first statement that needs it (after the import checks)
+        is_direct_sql = None
 
         # find function calls
         self._function_call_visitor.visit(tree)
@@ -490,16 +472,19 @@ Code running:
                 self._check_imports(node)
                 continue
 
-            if (
-                self._is_df_overwrite(node)
-                or self._is_jailbreak(node)
-                or self._is_unsafe(node)
-            ):
+            if self._is_df_overwrite(node) or self._is_jailbreak(node):
+                continue
+
+            node_source = astor.to_source(node)
+            if self._is_unsafe(node_source):
                 continue
 
+            if is_direct_sql is None:
+                is_direct_sql = self._validate_direct_sql(self._dfs)
+
             # if generated code contain execute_sql_query def remove it
             # function already defined
-            if self.check_direct_sql_func_def_exists(node):
+            if self.check_direct_sql_func_def_exists(node, is_direct_sql):
                 continue
 
             if self.check_skill_func_def_exists(node, context):
@@ -507,7 +492,7 @@ Code running:
 
             # if generated code contain execute_sql_query usage
             if (
-                self._validate_direct_sql(self._dfs)
+                is_direct_sql
                 and "execute_sql_query" in self._function_call_visitor.function_calls
             ):
                 execute_sql_query_used = True
@@ -515,10 +500,12 @@ Code running:
             # Sanity for sql query the code should only use allowed tables
             if self._config.direct_sql:
                 node = self._validate_and_make_table_name_case_sensitive(node)
+                # Table names may have been rewritten in place
+                node_source = astor.to_source(node)
 
             self.find_function_calls(node, context)
 
-            clean_code_lines.append(astor.to_source(node))
+            clean_code_lines.append(node_source)
 
             new_body.append(
                 self._extract_fix_dataframe_redeclarations(
@@ -571,8 +558,8 @@ Code running:
             return
 
         if (
-            library
-            in WHITELISTED_LIBRARIES + self._config.custom_whitelisted_dependencies
+            library in WHITELISTED_LIBRARIES_SET
+            or library in self._config.custom_whitelisted_dependencies
         ):
             for alias in node.names:
                 self._additional_dependencies.append(
@@ -584,5 +571,5 @@ Code running:
                 )
             return
 
-        if library not in WHITELISTED_BUILTINS:
+        if library not in WHITELISTED_BUILTINS_SET:
             raise BadImportError(library)
@@ -1,3 +1,4 @@
+import traceback
 from typing import Optional
 
 from pandasai.agent.base_judge import BaseJudge
@@ -220,8 +221,6 @@ class GenerateChatPipeline:
 
         except Exception as e:
             # Show the full traceback
-            import traceback
-
             traceback.print_exc()
 
             self.last_error = str(e)
@@ -278,8 +277,6 @@ class GenerateChatPipeline:
 
         except Exception as e:
             # Show the full traceback
-            import traceback
-
             traceback.print_exc()
 
             self.last_error = str(e)
@@ -353,8 +350,6 @@ class GenerateChatPipeline:
 
         except Exception as e:
             # Show the full traceback
-            import traceback
-
             traceback.print_exc()
 
             self.last_error = str(e)
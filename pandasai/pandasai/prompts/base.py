@@ -4,10 +4,27 @@ In order to better handle the instructions, this prompt module is written.
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
+
+EXTRA_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
+@lru_cache(maxsize=None)
+def get_templates_environment(templates_dir: str) -> Environment:
+    """Return a shared environment for a templates directory, so that
+    compiled templates are cached across prompt instances. Templates ship
+    with the package, so they are not checked for changes on every load."""
+    return Environment(loader=FileSystemLoader(templates_dir), auto_reload=False)
+
+
+@lru_cache(maxsize=128)
+def compile_template(template: str) -> Template:
+    """Compile an inline template string once."""
+    return Environment().from_string(template)
 
 
 class BasePrompt:
@@ -24,13 +41,12 @@ class BasePrompt:
         self.props = kwargs
 
         if self.template:
-            env = Environment()
-            self.prompt = env.from_string(self.template)
+            self.prompt = compile_template(self.template)
         elif self.template_path:
             # find path to template file
             current_dir_path = Path(__file__).parent
             path_to_template = os.path.join(current_dir_path, "templates")
-            env = Environment(loader=FileSystemLoader(path_to_template))
+            env = get_templates_environment(path_to_template)
             self.prompt = env.get_template(self.template_path)
 
         self._resolved_prompt = None
@@ -40,7 +56,8 @@ class BasePrompt:
         render = self.prompt.render(**self.props)
 
         # Remove additional newlines in render
-        render = re.sub(r"\n{3,}", "\n\n", render)
+        if "\n\n\n" in render:
+            render = EXTRA_NEWLINES_PATTERN.sub("\n\n", render)
 
         return render
 
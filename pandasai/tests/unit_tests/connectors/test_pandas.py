@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from pandasai.connectors import PandasConnector
+from pandasai.connectors.pandas import transpile_to_duckdb
 
 
 class TestPandasConnector:
@@ -73,3 +74,26 @@ class TestPandasConnector:
         connector = PandasConnector({"original_df": input_data})
         with pytest.raises(Exception):
             connector.enable_sql_query()
+
+    def test_execute_direct_sql_query(self):
+        connector = PandasConnector(
+            {"original_df": pd.DataFrame({"column1": [1, 2, 3]})},
+            name="test_execute_direct_sql_query",
+        )
+        sql_query = "SELECT SUM(column1) AS total FROM test_execute_direct_sql_query"
+
+        assert connector.execute_direct_sql_query(sql_query)["total"][0] == 6
+        assert connector.execute_direct_sql_query(sql_query)["total"][0] == 6
+
+    def test_transpile_to_duckdb_is_cached(self, mocker):
+        transpile = mocker.patch(
+            "pandasai.connectors.pandas.sqlglot.transpile",
+            return_value=["SELECT 1"],
+        )
+        transpile_to_duckdb.cache_clear()
+
+        assert transpile_to_duckdb("SELECT 1") == "SELECT 1"
+        assert transpile_to_duckdb("SELECT 1") == "SELECT 1"
+        transpile.assert_called_once_with("SELECT 1", read="mysql", write="duckdb")
+
+        transpile_to_duckdb.cache_clear()
@@ -123,6 +123,16 @@ WHERE column_name = :value_0 ORDER BY RAND() ASC
         result = self.connector._is_sql_query_safe(malicious_query)
         assert result is False
 
+    def test_is_sql_query_safe_malicious_query_lowercase(self):
+        malicious_query = "select * from users; delete from users"
+        result = self.connector._is_sql_query_safe(malicious_query)
+        assert result is False
+
+    def test_is_sql_query_safe_keyword_inside_identifier(self):
+        safe_query = "SELECT created_at, updated_by FROM users"
+        result = self.connector._is_sql_query_safe(safe_query)
+        assert result is True
+
     @patch("pandasai.connectors.sql.pd.read_sql", autospec=True)
     def test_execute_direct_sql_query_safe_query(self, mock_sql):
         safe_query = "SELECT * FROM users WHERE username = 'John'"
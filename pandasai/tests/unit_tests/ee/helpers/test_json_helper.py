@@ -0,0 +1,22 @@
+import pytest
+
+from pandasai.ee.helpers.json_helper import extract_json_from_json_str
+
+
+class TestJsonHelper:
+    def test_extract_json_without_code_fence(self):
+        assert extract_json_from_json_str('{"name": "orders"}') == {"name": "orders"}
+
+    def test_extract_json_from_json_code_fence(self):
+        json_str = 'Here is the schema:\n```json\n[{"name": "orders"}]\n```\nDone.'
+
+        assert extract_json_from_json_str(json_str) == [{"name": "orders"}]
+
+    def test_extract_json_from_plain_code_fence(self):
+        json_str = '```\n{"name": "orders"}\n```'
+
+        assert extract_json_from_json_str(json_str) == {"name": "orders"}
+
+    def test_extract_json_invalid(self):
+        with pytest.raises(ValueError):
+            extract_json_from_json_str("```json\nnot json\n```")
@@ -0,0 +1,54 @@
+import numpy as np
+
+import pandasai.pandas as pd
+from pandasai.helpers.data_sampler import MAX_ROWS_TO_SCAN, DataSampler
+
+
+class TestDataSampler:
+    def test_sample_keeps_columns_and_size(self):
+        df = pd.DataFrame(
+            {"country": ["Spain", "Italy", "France", "Germany"], "gdp": [1, 2, 3, 4]}
+        )
+
+        sampled_df = DataSampler(df).sample(3)
+
+        assert list(sampled_df.columns) == ["country", "gdp"]
+        assert len(sampled_df) == 3
+        assert set(sampled_df["country"]) <= set(df["country"])
+
+    def test_sample_includes_null_values(self):
+        df = pd.DataFrame(
+            {"country": ["Spain", None, "France", "Germany"], "gdp": [1, 2, 3, 4]}
+        )
+
+        sampled_df = DataSampler(df).sample(3)
+
+        assert sampled_df["country"].isna().sum() == 1
+        assert sampled_df["gdp"].isna().sum() == 0
+
+    def test_sample_column_repeats_values_to_fill_sample(self):
+        df = pd.DataFrame({"country": ["Spain", "Spain", np.nan, np.nan, np.nan]})
+
+        col_sample = DataSampler(df)._sample_column(df["country"], 3, True)
+
+        assert len(col_sample) == 3
+        assert col_sample.count("Spain") == 2
+
+    def test_sample_column_larger_than_scanned_rows(self):
+        df = pd.DataFrame({"value": range(MAX_ROWS_TO_SCAN * 5)})
+
+        col_sample = DataSampler(df)._sample_column(df["value"], 3, False)
+
+        assert len(col_sample) == 3
+        assert len(set(col_sample)) == 3
+        assert set(col_sample) <= set(df["value"])
+
+    def test_sample_column_sparse_column_keeps_values(self):
+        values = [np.nan] * (MAX_ROWS_TO_SCAN * 100)
+        values[::10_000] = ["X"] * 10
+        df = pd.DataFrame({"a": values})
+
+        col_sample = DataSampler(df)._sample_column(df["a"], 3, True)
+
+        assert col_sample.count("X") == 2
+        assert sum(pd.isna(value) for value in col_sample) == 1
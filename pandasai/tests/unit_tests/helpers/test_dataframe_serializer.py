@@ -28,3 +28,26 @@ class TestDataframeSerializer(unittest.TestCase):
             extras={"index": 0, "type": "pd.Dataframe"},
         )
         self.assertIn("中文_描述", result)
+
+    def test_serialize_dispatches_on_type(self):
+        connector = PandasConnector(
+            {"original_df": pd.DataFrame({"a": [1, 2]})}, name="table"
+        )
+        extras = {"index": 0, "type": "pd.Dataframe"}
+
+        self.assertTrue(
+            self.serializer.serialize(
+                connector, extras=extras, type_=DataframeSerializerType.CSV
+            ).startswith('<dataframe name="table">')
+        )
+        self.assertTrue(
+            self.serializer.serialize(
+                connector, extras=extras, type_=DataframeSerializerType.SQL
+            ).startswith('<table name="table">')
+        )
+        self.assertIn(
+            '"dfs[0]"',
+            self.serializer.serialize(
+                connector, extras=extras, type_=DataframeSerializerType.JSON
+            ),
+        )
@@ -0,0 +1,76 @@
+from pandasai.helpers.memory import Memory
+
+
+class TestMemory:
+    def test_get_last_message_empty(self):
+        assert Memory().get_last_message() == ""
+
+    def test_get_last_message_query(self):
+        mem = Memory(memory_size=10)
+        mem.add("hello world", True)
+        mem.add("hi there", False)
+        mem.add("how are you?", True)
+
+        assert mem.get_last_message() == "### QUERY\n how are you?"
+
+    def test_get_last_message_truncates_answer(self):
+        mem = Memory(memory_size=10)
+        mem.add("hello world", True)
+        mem.add("a" * 150, False)
+
+        assert mem.get_last_message() == f"### ANSWER\n {'a' * 100} ..."
+
+    def test_get_last_message_matches_get_messages(self):
+        mem = Memory(memory_size=2)
+        for i in range(5):
+            mem.add(f"query {i}", True)
+            mem.add(f"answer {i}", False)
+
+        assert mem.get_last_message() == mem.get_messages()[-1]
+
+    def test_to_json(self):
+        mem = Memory(memory_size=10)
+        mem.add("hello world", True)
+        mem.add("hi there", False)
+
+        assert mem.to_json() == [
+            {"role": "user", "message": "hello world"},
+            {"role": "assistant", "message": "hi there"},
+        ]
+
+    def test_to_openai_messages(self):
+        mem = Memory(memory_size=10, agent_info="You are a data analyst")
+        mem.add("hello world", True)
+        mem.add("hi there", False)
+
+        assert mem.to_openai_messages() == [
+            {"role": "system", "content": "You are a data analyst"},
+            {"role": "user", "content": "hello world"},
+            {"role": "assistant", "content": "hi there"},
+        ]
+
+    def test_to_openai_messages_without_agent_info(self):
+        mem = Memory(memory_size=10)
+        mem.add("hello world", True)
+
+        assert mem.to_openai_messages() == [
+            {"role": "user", "content": "hello world"},
+        ]
+
+    def test_get_previous_conversation(self):
+        mem = Memory(memory_size=3)
+        mem.add("first query", True)
+        mem.add("first answer", False)
+        mem.add("second query", True)
+        mem.add("second answer", False)
+
+        assert (
+            mem.get_previous_conversation()
+            == "### ANSWER\n first answer\n### QUERY\n second query"
+        )
+
+    def test_get_previous_conversation_single_message(self):
+        mem = Memory(memory_size=3)
+        mem.add("hello world", True)
+
+        assert mem.get_previous_conversation() == ""
@@ -49,3 +49,16 @@ plt.show()
             result = add_save_chart(code, logger, file_name, save_charts_path)
             assert result == expected_code
             assert os.path.exists(save_charts_path)
+
+    def test_add_save_chart_without_chart(self):
+        code = """
+result = {"type": "number", "value": 42}
+"""
+        logger = Logger()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_charts_path = Path(temp_dir) / "charts"
+
+            result = add_save_chart(code, logger, "temp_chart", save_charts_path)
+            assert result == code
+            assert not os.path.exists(save_charts_path)
@@ -341,6 +341,46 @@ my_custom_library.do_something()
                 "np.array()\nexecute_sql_query()", context=context, logger=logger
             )
 
+    def test_bad_import_raised_before_invalid_direct_sql(
+        self,
+        code_cleaning: CodeCleaning,
+        context: PipelineContext,
+        logger: Logger,
+        sql_connector,
+        pgsql_connector,
+    ):
+        context.config.direct_sql = True
+        context.dfs = [sql_connector, pgsql_connector]
+
+        with pytest.raises(BadImportError):
+            code_cleaning.execute(
+                "import my_custom_library\nexecute_sql_query()",
+                context=context,
+                logger=logger,
+            )
+
+    def test_direct_sql_validated_once(
+        self,
+        code_cleaning: CodeCleaning,
+        context: PipelineContext,
+        logger: Logger,
+        pgsql_connector,
+        mocker,
+    ):
+        context.config.direct_sql = True
+        context.dfs = [pgsql_connector, pgsql_connector]
+        validate_spy = mocker.spy(code_cleaning, "_validate_direct_sql")
+        code = """
+def execute_sql_query(sql_query: str) -> pd.DataFrame:
+    return pd.DataFrame()
+np.array()
+execute_sql_query()
+"""
+
+        code_cleaning.execute(code, context=context, logger=logger)
+
+        validate_spy.assert_called_once()
+
     def test_clean_code_direct_sql_code(
         self,
         code_cleaning: CodeCleaning,
@@ -900,3 +940,29 @@ df = pd.DataFrame(data)
         node = code_cleaning._validate_and_make_table_name_case_sensitive(mock_node)
 
         assert node.value.args[0].value == 'SELECT COUNT(*) AS user_count FROM "Users"'
+
+    def test_is_malicious_code(self, code_cleaning: CodeCleaning):
+        assert code_cleaning._is_malicious_code("import os")
+        assert code_cleaning._is_malicious_code("from io import BytesIO")
+        assert code_cleaning._is_malicious_code("x = base64.b64decode(s)")
+        assert code_cleaning._is_malicious_code("x = ''.join(map(chr, codes))")
+        assert not code_cleaning._is_malicious_code("x = df['cost'].sum()")
+        assert not code_cleaning._is_malicious_code("result = {'positions': 1}")
+
+    def test_replace_table_names_single_pass(self, code_cleaning: CodeCleaning):
+        sql_query = (
+            "SELECT * FROM orders JOIN order_items ON orders.id = order_items.id"
+        )
+        allowed_table_names = {
+            "orders": '"Orders"',
+            "order_items": '"orders_Items"',
+        }
+
+        result = code_cleaning._replace_table_names(
+            sql_query, ["orders", "order_items"], allowed_table_names
+        )
+
+        assert (
+            result
+            == 'SELECT * FROM "Orders" JOIN "orders_Items" ON "Orders".id = "orders_Items".id'
+        )
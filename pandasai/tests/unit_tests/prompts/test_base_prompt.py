@@ -0,0 +1,25 @@
+"""Unit tests for the base prompt class"""
+
+from pandasai.prompts.base import BasePrompt
+from pandasai.prompts.generate_system_message import GenerateSystemMessagePrompt
+
+
+class TestBasePrompt:
+    """Unit tests for the base prompt class"""
+
+    def test_inline_template_is_compiled_once(self):
+        class GreetingPrompt(BasePrompt):
+            template: str = "Hello {{ name }}!"
+
+        first = GreetingPrompt(name="Alice")
+        second = GreetingPrompt(name="Bob")
+
+        assert first.prompt is second.prompt
+        assert first.to_string() == "Hello Alice!"
+        assert second.to_string() == "Hello Bob!"
+
+    def test_template_file_is_loaded_once(self):
+        first = GenerateSystemMessagePrompt(memory=None)
+        second = GenerateSystemMessagePrompt(memory=None)
+
+        assert first.prompt is second.prompt
@@ -130,6 +130,56 @@ class TestSkills:
         retrieved_skill = skills_manager.get_skill_by_func_name("SkillC")
         assert retrieved_skill is None
 
+    def test_reassign_skills(self):
+        skills_manager = SkillsManager()
+        skill1 = Mock()
+        skill2 = Mock()
+        skill1.name = "SkillA"
+        skill2.name = "SkillB"
+        skills_manager.add_skills(skill1)
+
+        skills_manager.skills = [skill2]
+
+        assert not skills_manager.skill_exists("SkillA")
+        assert skills_manager.get_skill_by_func_name("SkillB") == skill2
+
+    def test_mutate_skills_in_place(self):
+        skills_manager = SkillsManager()
+        skill1 = Mock()
+        skill2 = Mock()
+        skill3 = Mock()
+        skill1.name = "SkillA"
+        skill2.name = "SkillB"
+        skill3.name = "SkillC"
+        skills_manager.add_skills(skill1)
+        assert skills_manager.skill_exists("SkillA")
+
+        skills_manager.skills.append(skill2)
+        assert skills_manager.get_skill_by_func_name("SkillB") == skill2
+
+        skills_manager.skills.remove(skill1)
+        assert not skills_manager.skill_exists("SkillA")
+
+        skills_manager.skills[0] = skill3
+        assert not skills_manager.skill_exists("SkillB")
+        assert skills_manager.get_skill_by_func_name("SkillC") == skill3
+
+        # a removed skill can be added again
+        skills_manager.add_skills(skill1)
+        assert skills_manager.skill_exists("SkillA")
+
+    def test_rename_skill_in_place(self):
+        skills_manager = SkillsManager()
+        skill1 = Mock()
+        skill1.name = "SkillA"
+        skills_manager.add_skills(skill1)
+        assert skills_manager.skill_exists("SkillA")
+
+        skill1.name = "SkillRenamed"
+
+        assert not skills_manager.skill_exists("SkillA")
+        assert skills_manager.get_skill_by_func_name("SkillRenamed") == skill1
+
     def test_add_used_skill(self):
         skills_manager = SkillsManager()
         skill1 = Mock()